@@ -4,18 +4,37 @@ Meticulous Board — Single-file Obsidian Board Server
 Runs locally on port 7783. Reads/writes a single Board.md file in your Obsidian vault.
 """
 
+import base64
+import gzip
+import hashlib
 import json
 import os
 import re
+import string
 import sys
 import tempfile
+import threading
 import unicodedata
 from datetime import date
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from functools import lru_cache
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urlparse, parse_qs
+from urllib.request import getproxies, proxy_bypass
+from urllib.error import URLError
+
+# orjson is optional: used for API bodies and the chat stream when installed
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
 
 PORT = 7783
 DEFAULT_VAULT = Path.home() / "Documents" / "Obsidian"
@@ -23,30 +42,59 @@ DEFAULT_BOARD_FILE = "Meticulous/Board.md"
 
 # Load .env.local if present (key=value, supports quotes, ignores comments)
 _env_path = Path(__file__).parent / ".env.local"
-if _env_path.exists():
-    for _line in _env_path.read_text().splitlines():
-        _line = _line.strip()
-        if not _line or _line.startswith("#"):
-            continue
-        if "=" in _line:
-            _k, _, _v = _line.partition("=")
-            os.environ.setdefault(_k.strip(), _v.strip().strip("'\""))
+try:
+    with open(_env_path) as _f:
+        for _line in _f:
+            _line = _line.strip()
+            if not _line or _line[0] == "#":
+                continue
+            _k, _sep, _v = _line.partition("=")
+            if _sep:
+                os.environ.setdefault(_k.strip(), _v.strip().strip("'\""))
+except FileNotFoundError:
+    pass
 
 CONFIG_PATH = Path(__file__).parent / "config.json"
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 CLAUDE_MODEL = "claude-sonnet-4-20250514"
 CLAUDE_API_URL = "https://api.anthropic.com/v1/messages"
 
+# slugify(): lowercases ASCII, turns "_" into a space and deletes anything outside
+# [\w\s-] in one translate()
+_SLUG_TRANS = str.maketrans(
+    string.ascii_uppercase + "_",
+    string.ascii_lowercase + " ",
+    "".join(c for c in map(chr, range(128)) if re.match(r"[^\w\s-]", c)),
+)
+
+
+# In-process caches, validated against the file's (mtime_ns, size)
+_CONFIG_CACHE = {"key": None, "value": None}
+# fn_labels is the {function key: label} index for data, built on demand
+_BOARD_CACHE = {"key": None, "data": None, "mtime": 0, "fn_labels": None, "digest": None}
+# Serializes vault writes (and brief numbering) across request threads
+_WRITE_LOCK = threading.RLock()
+# Guards _BOARD_CACHE reads and updates only; never held across disk I/O,
+# so a cache hit never waits behind a write's fsync
+_CACHE_LOCK = threading.Lock()
+
 
 def load_config():
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH) as f:
-            cfg = json.load(f)
-            return (
-                Path(cfg.get("vault_path", str(DEFAULT_VAULT))),
-                cfg.get("board_file", DEFAULT_BOARD_FILE),
-            )
-    return DEFAULT_VAULT, DEFAULT_BOARD_FILE
+    try:
+        st = CONFIG_PATH.stat()
+    except OSError:
+        return DEFAULT_VAULT, DEFAULT_BOARD_FILE
+    key = (st.st_mtime_ns, st.st_size)
+    if _CONFIG_CACHE["key"] == key:
+        return _CONFIG_CACHE["value"]
+    with open(CONFIG_PATH) as f:
+        cfg = json.load(f)
+    value = (
+        Path(cfg.get("vault_path", str(DEFAULT_VAULT))),
+        cfg.get("board_file", DEFAULT_BOARD_FILE),
+    )
+    _CONFIG_CACHE.update(key=key, value=value)
+    return value
 
 
 def board_path():
@@ -56,9 +104,25 @@ def board_path():
 
 # ─── Markdown Parser ───────────────────────────────────────────
 
-
-def parse_board(text):
-    """Parse Board.md into a JSON-friendly dict."""
+# "## Heading" (lowercased) → (section, column key)
+_HEADING_MAP = {
+    "pillars": ("pillars", None),
+    "team": ("team", None),
+    "functions": ("functions", None),
+    "inbox": ("cards", "inbox"),
+    "now": ("cards", "now"),
+    "next up": ("cards", "next"),
+    "next": ("cards", "next"),
+    "waiting": ("cards", "waiting"),
+    "done": ("cards", "done"),
+}
+# Prefixes that mark a card's continuation (note) line
+_INDENT = ("  ", "\t")
+
+
+def parse_board(lines):
+    """Parse Board.md lines (any iterable of str, e.g. an open file) into a
+    JSON-friendly dict."""
     pillars = []
     owners = []
     functions = []
@@ -67,93 +131,67 @@ def parse_board(text):
     section = None
     current_card = None
     col_key = None
+    # Note lines are collected per card and joined once at the end
+    note_lines = None
+    card_notes = []
 
-    for raw_line in text.split("\n"):
+    for raw_line in lines:
         line = raw_line.rstrip()
+        # Dispatch on the first two chars instead of repeated startswith()
+        head = line[:2]
 
         # Detect section headers
-        if line.startswith("## "):
+        if head == "##" and line.startswith("## "):
             heading = line[3:].strip().lower()
-            # Flush any in-progress card
-            if current_card and col_key:
-                columns[col_key].append(current_card)
-                current_card = None
-
-            if heading == "pillars":
-                section = "pillars"
-            elif heading == "team":
-                section = "team"
-            elif heading == "functions":
-                section = "functions"
-            elif heading in ("inbox",):
-                section = "cards"
-                col_key = "inbox"
-            elif heading in ("now",):
-                section = "cards"
-                col_key = "now"
-            elif heading in ("next up", "next"):
-                section = "cards"
-                col_key = "next"
-            elif heading in ("waiting",):
-                section = "cards"
-                col_key = "waiting"
-            elif heading in ("done",):
-                section = "cards"
-                col_key = "done"
-            else:
-                section = None
-            continue
-
-        # Skip top-level heading and blank lines at section level
-        if line.startswith("# "):
-            continue
-
-        # ── Pillars section ──
-        if section == "pillars" and line.startswith("- "):
-            pillar = parse_pillar_line(line[2:])
-            if pillar:
-                pillars.append(pillar)
+            # End any in-progress card
+            current_card = None
+            section, col_key = _HEADING_MAP.get(heading, (None, col_key))
             continue
 
-        # ── Team section ──
-        if section == "team" and line.startswith("- "):
-            owner = parse_owner_line(line[2:])
-            if owner:
-                owners.append(owner)
+        # Skip top-level heading
+        if head == "# ":
             continue
 
-        # ── Functions section ──
-        if section == "functions" and line.startswith("- "):
-            func = parse_function_line(line[2:])
-            if func:
-                functions.append(func)
-            continue
-
-        # ── Cards section ──
-        if section == "cards" and col_key:
-            if line.startswith("- "):
-                # Flush previous card
-                if current_card:
-                    columns[col_key].append(current_card)
+        if head == "- ":
+            # ── Cards section (by far the most common item line) ──
+            if section == "cards":
                 current_card = parse_card_line(line[2:])
-            elif current_card and (line.startswith("  ") or line.startswith("\t")):
-                # Indented continuation
-                note_line = line.strip()
-                if note_line:
-                    if note_line.startswith(">> ") and not current_card.get("nextAction"):
-                        current_card["nextAction"] = note_line[3:]
-                    elif current_card.get("note"):
-                        current_card["note"] += "\n" + note_line
-                    else:
-                        current_card["note"] = note_line
-            elif line.strip() == "" and current_card:
-                # Blank line inside a card's note block — keep going
-                pass
+                columns[col_key].append(current_card)
+                note_lines = []
+                card_notes.append((current_card, note_lines))
+
+            # ── Pillars section ──
+            elif section == "pillars":
+                pillar = parse_pillar_line(line[2:])
+                if pillar:
+                    pillars.append(pillar)
+
+            # ── Team section ──
+            elif section == "team":
+                owner = parse_owner_line(line[2:])
+                if owner:
+                    owners.append(owner)
+
+            # ── Functions section ──
+            elif section == "functions":
+                func = parse_function_line(line[2:])
+                if func:
+                    functions.append(func)
             continue
 
-    # Flush last card
-    if current_card and col_key:
-        columns[col_key].append(current_card)
+        # Indented continuation of the current card; blank lines inside a
+        # card's note block are skipped
+        if section == "cards" and current_card and line.startswith(_INDENT):
+            note_line = line.lstrip()  # line is already rstripped
+            if note_line:
+                if note_line.startswith(">> ") and not current_card["nextAction"]:
+                    current_card["nextAction"] = note_line[3:]
+                else:
+                    note_lines.append(note_line)
+
+    for card, card_note_lines in card_notes:
+        if card_note_lines:
+            card["note"] = "\n".join(card_note_lines)
 
     return {
         "pillars": pillars,
@@ -163,6 +201,23 @@ def parse_board(text):
     }
 
 
+def parse_functions_only(lines):
+    """Parse just the Functions section, stopping at the heading after it."""
+    functions = []
+    in_functions = False
+    for raw_line in lines:
+        line = raw_line.rstrip()
+        if line.startswith("## "):
+            if in_functions:
+                break
+            in_functions = _HEADING_MAP.get(line[3:].strip().lower(), (None,))[0] == "functions"
+        elif in_functions and line.startswith("- "):
+            func = parse_function_line(line[2:])
+            if func:
+                functions.append(func)
+    return functions
+
+
 def parse_pillar_line(text):
     """Parse: 📦 Delivery Excellence | #1565C0 | description"""
     parts = [p.strip() for p in text.split("|")]
@@ -178,10 +233,9 @@ def parse_pillar_line(text):
     name = name_part
     if name_part:
         # Grab leading emoji (could be multi-codepoint)
-        m = re.match(r"^(\S+)\s+(.*)", name_part)
-        if m:
-            icon = m.group(1)
-            name = m.group(2)
+        head = name_part.split(None, 1)
+        if len(head) == 2:
+            icon, name = head
 
     return {"icon": icon, "name": name, "color": color, "desc": desc}
 
@@ -210,173 +264,222 @@ def parse_function_line(text):
     }
 
 
+# One alternation covering every card token, plus a plain-word fallback, so
+# finditer() walks the whole line left to right in a single pass. Owner and
+# pillar values may span words, up to the next word that starts a token.
+_CARD_STOP = r"(?:[#>@\[]|\*\*|[!^]\d{4}-\d{2}-\d{2})"
+# A pillar is written after owner and function, so it only stops at what
+# serialize_card() can put after it; names like "Growth [EU]" or
+# "Growth @ Scale" stay whole
+_PILLAR_STOP = r"(?:\[\[|\*\*|[!^]\d{4}-\d{2}-\d{2})"
+_RE_CARD_TOKEN = re.compile(
+    r"\*\*(?P<title>.+?)\*\*"
+    r"|(?P<link>\[\[.+?\]\])"
+    r"|\[(?P<priority>(?i:high|medium|low))\]"
+    r"|\^(?P<movedAt>\d{4}-\d{2}-\d{2})"
+    r"|!(?P<due>\d{4}-\d{2}-\d{2})"
+    r"|@(?P<owner>\S+(?:\s+(?!" + _CARD_STOP + r")\S+)*)"
+    r"|#(?P<fn>\S+)"
+    r"|>(?P<pillar>[^*\s]*(?:\s+(?!" + _PILLAR_STOP + r")[^*\s]+)*)"
+    r"|(?P<word>\S+)"
+)
+
+
 def parse_card_line(text):
     """Parse: **Title** [priority] @Owner #function >Pillar [[link]]"""
     card = {"title": "", "priority": "medium", "owner": "", "fn": "", "pillar": "", "link": "", "note": "", "due": "", "nextAction": "", "movedAt": ""}
 
-    # Extract ^YYYY-MM-DD movedAt date
-    m = re.search(r"\^(\d{4}-\d{2}-\d{2})", text)
-    if m:
-        card["movedAt"] = m.group(1)
-        text = text[: m.start()] + text[m.end() :]
-
-    # Extract !YYYY-MM-DD due date
-    m = re.search(r"!(\d{4}-\d{2}-\d{2})", text)
-    if m:
-        card["due"] = m.group(1)
-        text = text[: m.start()] + text[m.end() :]
-
-    # Extract [[link]]
-    m = re.search(r"\[\[(.+?)\]\]", text)
-    if m:
-        card["link"] = "[[" + m.group(1) + "]]"
-        text = text[: m.start()] + text[m.end() :]
-
-    # Extract [priority]
-    m = re.search(r"\[(high|medium|low)\]", text, re.IGNORECASE)
-    if m:
-        card["priority"] = m.group(1).lower()
-        text = text[: m.start()] + text[m.end() :]
-
-    # Extract @Owner
-    m = re.search(r"@(\S+(?:\s+\S+)*?)(?=\s+[#>@\[]|$)", text)
-    if m:
-        card["owner"] = m.group(1).strip()
-        text = text[: m.start()] + text[m.end() :]
-
-    # Extract #function
-    m = re.search(r"#(\S+)", text)
-    if m:
-        card["fn"] = m.group(1)
-        text = text[: m.start()] + text[m.end() :]
-
-    # Extract >Pillar (everything after > until ** or end of string)
-    m = re.search(r">([^*]+)", text)
-    if m:
-        card["pillar"] = m.group(1).strip()
-        text = text[: m.start()] + text[m.end() :]
-
-    # Extract **Title**
-    m = re.search(r"\*\*(.+?)\*\*", text)
-    if m:
-        card["title"] = m.group(1).strip()
-    else:
+    # The first occurrence of each token wins; other words are recorded as
+    # spans, and the fallback title is only built from them when no
+    # **Title** was found.
+    found = set()
+    rest = []
+    for m in _RE_CARD_TOKEN.finditer(text):
+        field = m.lastgroup
+        if field == "word" or field in found:
+            rest.append(m.span())
+            continue
+        value = m.group(field)
+        if field == "priority":
+            value = value.lower()
+        elif field == "title" or field == "pillar":
+            value = value.strip()
+        card[field] = value
+        if value or field == "title":
+            found.add(field)
+
+    if "title" not in found:
         # Fallback: use whatever remains as title
-        card["title"] = text.strip().strip("-").strip()
+        card["title"] = " ".join([text[a:b] for a, b in rest]).strip("-").strip()
 
     return card
 
 
 # ─── Markdown Serializer ──────────────────────────────────────
 
+# Column key → "## Title" heading line, in Board.md order
+_COLUMN_HEADINGS = [
+    (col_key, f"## {title}\n")
+    for col_key, title in [("inbox", "Inbox"), ("now", "Now"), ("next", "Next Up"), ("waiting", "Waiting"), ("done", "Done")]
+]
+
 
-def serialize_board(data):
-    """Serialize board data dict back to Board.md markdown."""
-    lines = ["# Meticulous Board", ""]
+def iter_serialize_board(data):
+    """Serialize board data dict back to Board.md markdown, one line at a time."""
+    yield "# Meticulous Board\n"
 
     # Pillars
-    lines.append("## Pillars")
+    yield "\n"
+    yield "## Pillars\n"
     for p in data.get("pillars", []):
         desc_part = f" | {p['desc']}" if p.get("desc") else ""
-        lines.append(f"- {p.get('icon', '🎯')} {p['name']} | {p.get('color', '#1F1F1F')}{desc_part}")
-    lines.append("")
+        yield f"- {p.get('icon', '🎯')} {p['name']} | {p.get('color', '#1F1F1F')}{desc_part}\n"
 
     # Team
-    lines.append("## Team")
+    yield "\n"
+    yield "## Team\n"
     for o in data.get("owners", []):
-        lines.append(f"- {o['name']} | {o['initials']} | {o.get('color', '#1F1F1F')}")
-    lines.append("")
+        yield f"- {o['name']} | {o['initials']} | {o.get('color', '#1F1F1F')}\n"
 
     # Functions
-    lines.append("## Functions")
+    yield "\n"
+    yield "## Functions\n"
     for f in data.get("functions", []):
-        lines.append(f"- {f['key']} | {f['label']} | {f.get('color', '#8A8A88')}")
-    lines.append("")
+        yield f"- {f['key']} | {f['label']} | {f.get('color', '#8A8A88')}\n"
 
     # Columns
-    col_headings = [("inbox", "Inbox"), ("now", "Now"), ("next", "Next Up"), ("waiting", "Waiting"), ("done", "Done")]
     columns = data.get("columns", {})
-    for col_key, col_title in col_headings:
+    for col_key, heading in _COLUMN_HEADINGS:
         cards = columns.get(col_key, [])
-        lines.append(f"## {col_title}")
+        yield "\n"
+        yield heading
         for c in cards:
-            lines.append(serialize_card(c))
+            yield f"{serialize_card(c)}\n"
             if c.get("nextAction"):
-                lines.append(f"  >> {c['nextAction']}")
+                yield f"  >> {c['nextAction']}\n"
             if c.get("note"):
                 for note_line in c["note"].split("\n"):
-                    lines.append(f"  {note_line}")
-        lines.append("")
-
-    return "\n".join(lines)
+                    yield f"  {note_line}\n"
 
 
 def serialize_card(card):
     """Serialize a single card to its markdown line."""
-    parts = [f"- **{card['title']}**"]
+    get = card.get
+    out = f"- **{card['title']}**"
 
-    if card.get("priority") and card["priority"] != "medium":
-        parts.append(f"[{card['priority']}]")
+    priority = get("priority")
+    if priority and priority != "medium":
+        out += f" [{priority}]"
 
-    if card.get("owner"):
-        parts.append(f"@{card['owner']}")
+    owner = get("owner")
+    if owner:
+        out += f" @{owner}"
 
-    if card.get("fn"):
-        parts.append(f"#{card['fn']}")
+    fn = get("fn")
+    if fn:
+        out += f" #{fn}"
 
-    if card.get("pillar"):
-        parts.append(f">{card['pillar']}")
+    pillar = get("pillar")
+    if pillar:
+        out += f" >{pillar}"
 
-    if card.get("due"):
-        parts.append(f"!{card['due']}")
+    due = get("due")
+    if due:
+        out += f" !{due}"
 
-    if card.get("movedAt"):
-        parts.append(f"^{card['movedAt']}")
+    moved = get("movedAt")
+    if moved:
+        out += f" ^{moved}"
 
-    if card.get("link"):
-        link = card["link"]
+    link = get("link")
+    if link:
         if not link.startswith("[["):
             link = f"[[{link}]]"
-        parts.append(link)
+        out += f" {link}"
 
-    return " ".join(parts)
+    return out
 
 
 # ─── File I/O ──────────────────────────────────────────────────
 
 
 def read_board():
-    """Read and parse the board file. Returns (data_dict, mtime)."""
+    """Read and parse the board file. Returns (data_dict, mtime).
+
+    The parsed board is cached and only re-read when the file changes.
+    """
     fp = board_path()
-    if not fp.exists():
+    try:
+        st = fp.stat()
+    except OSError:
         return None, 0
-    text = fp.read_text(encoding="utf-8")
-    data = parse_board(text)
-    mtime = fp.stat().st_mtime
-    return data, mtime
+    key = (str(fp), st.st_mtime_ns, st.st_size)
+    with _CACHE_LOCK:
+        if _BOARD_CACHE["key"] == key:
+            return _BOARD_CACHE["data"], _BOARD_CACHE["mtime"]
+    # Parse outside the lock so concurrent reads don't queue behind it;
+    # stream the file line by line rather than holding the whole text
+    with open(fp, encoding="utf-8") as f:
+        data = parse_board(f)
+    with _CACHE_LOCK:
+        _BOARD_CACHE.update(key=key, data=data, mtime=st.st_mtime, fn_labels=None, digest=None)
+    return data, st.st_mtime
+
+
+def atomic_write(filepath, data):
+    """Atomically write bytes, or an iterable of byte chunks, to filepath
+    via a temp file + os.replace(). Returns the written file's stat result
+    (unchanged by the rename)."""
+    fd, tmp = tempfile.mkstemp(dir=str(filepath.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb", buffering=64 * 1024) as f:
+            if isinstance(data, (bytes, bytearray)):
+                f.write(data)
+            else:
+                f.writelines(data)
+            f.flush()
+            os.fsync(fd)
+            st = os.fstat(fd)
+        os.replace(tmp, str(filepath))
+    except BaseException:
+        try: os.unlink(tmp)
+        except OSError: pass
+        raise
+    return st
 
 
 def write_board(data):
     """Atomically write the board file."""
     fp = board_path()
     fp.parent.mkdir(parents=True, exist_ok=True)
-    text = serialize_board(data)
-    # Atomic write: write to temp file then replace
-    fd, tmp = tempfile.mkstemp(dir=str(fp.parent), suffix=".tmp")
-    closed = False
-    try:
-        os.write(fd, text.encode("utf-8"))
-        os.close(fd)
-        closed = True
-        os.replace(tmp, str(fp))
-    except Exception:
-        if not closed:
-            try: os.close(fd)
-            except OSError: pass
-        if os.path.exists(tmp):
-            os.unlink(tmp)
-        raise
-    return fp.stat().st_mtime
+    digest = hashlib.blake2b(json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8"), digest_size=16).digest()
+    with _WRITE_LOCK:
+        # A PUT identical to the last one we wrote, with the file untouched
+        # since, is a no-op: skip the serialize and the fsync. Checked under
+        # the write lock, so a save still in flight can't make an older
+        # digest look current and swallow this one.
+        try:
+            st = fp.stat()
+        except OSError:
+            st = None
+        with _CACHE_LOCK:
+            if st and _BOARD_CACHE["digest"] == digest and _BOARD_CACHE["key"] == (str(fp), st.st_mtime_ns, st.st_size):
+                return _BOARD_CACHE["mtime"]
+        # Stream encoded lines straight into the temp file instead of
+        # building the whole document first
+        st = atomic_write(fp, (line.encode("utf-8") for line in iter_serialize_board(data)))
+    # Prime the cache by streaming the file back, so it holds exactly what a
+    # re-read would return. fstat() confirms the open file is the one we
+    # wrote; if a newer write has replaced it, leave the cache to that write.
+    key = (str(fp), st.st_mtime_ns, st.st_size)
+    with open(fp, encoding="utf-8") as f:
+        fst = os.fstat(f.fileno())
+        if (str(fp), fst.st_mtime_ns, fst.st_size) != key:
+            return st.st_mtime
+        parsed = parse_board(f)
+    with _CACHE_LOCK:
+        _BOARD_CACHE.update(key=key, data=parsed, mtime=st.st_mtime, fn_labels=None, digest=digest)
+    return st.st_mtime
 
 
 def create_default_board():
@@ -414,33 +517,97 @@ def create_default_board():
 # ─── Brief Creation ───────────────────────────────────────────
 
 
+# Brief markdown skeleton; {context} is the block of "- **Field:** value" lines
+_BRIEF_TEMPLATE = "\n".join([
+    "# {title}",
+    "",
+    "## Objective",
+    "_What needs to happen and why._",
+    "",
+    "## Context",
+    "{context}",
+    "",
+    "## Current Situation",
+    "_What is the current state? What has already been tried or decided?_",
+    "",
+    "## Actions Required",
+    "- [ ] ",
+    "- [ ] ",
+    "- [ ] ",
+    "",
+    "## Deliverables",
+    "_List what needs to be produced (email draft, document, ticket, etc.):_",
+    "- ",
+    "",
+    "## Done When",
+    "- ",
+    "",
+    "## Notes",
+    "{note}",
+    "",
+])
+
+
+@lru_cache(maxsize=256)
 def slugify(text):
     """Convert title to a filename-safe slug."""
-    text = unicodedata.normalize("NFKD", text)
-    text = text.encode("ascii", "ignore").decode("ascii")
-    text = re.sub(r"[^\w\s-]", "", text.lower())
-    text = re.sub(r"[\s_]+", "-", text).strip("-")
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = text.encode("ascii", "ignore").decode("ascii")
+    # split() drops whitespace runs, so joining with "-" collapses them
+    text = "-".join(text.translate(_SLUG_TRANS).split()).strip("-")
     return text[:60]
 
 
 def next_brief_number():
-    """Count existing brief_*.md files and return next number."""
+    """Scan existing brief_*.md files and return next number."""
     vault, _ = load_config()
     briefs_dir = vault / "Meticulous" / "Briefs"
-    if not briefs_dir.exists():
-        return 1
-    existing = sorted(briefs_dir.glob("brief_*.md"))
-    if not existing:
-        return 1
-    # Extract highest number from existing files
+    # Single directory pass over entry names; no Path objects, no sort
     highest = 0
-    for f in existing:
-        m = re.match(r"brief_(\d+)", f.stem)
-        if m:
-            highest = max(highest, int(m.group(1)))
+    try:
+        with os.scandir(briefs_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("brief_") and name.endswith(".md"):
+                    # Leading digits after "brief_" (brief_07_slug.md, brief_10.md)
+                    tail = name[6:]
+                    n = len(tail) - len(tail.lstrip("0123456789"))
+                    if n:
+                        highest = max(highest, int(tail[:n]))
+    except FileNotFoundError:
+        return 1
     return highest + 1
 
 
+def get_fn_label(key, default=""):
+    """Label for a function key, from an index built once per cached board."""
+    fp = board_path()
+    try:
+        st = fp.stat()
+    except OSError:
+        return default
+    with _CACHE_LOCK:
+        board_data = _BOARD_CACHE["data"] if _BOARD_CACHE["key"] == (str(fp), st.st_mtime_ns, st.st_size) else None
+        labels = _BOARD_CACHE["fn_labels"] if board_data is not None else None
+    if labels is None:
+        if board_data is None:
+            # Cold cache: scan just the Functions section, not the whole board
+            with open(fp, encoding="utf-8") as f:
+                functions = parse_functions_only(f)
+        else:
+            functions = board_data.get("functions", [])
+        labels = {}
+        for f in functions:
+            if "label" in f:
+                labels.setdefault(f.get("key"), f["label"])
+        if board_data is not None:
+            with _CACHE_LOCK:
+                if _BOARD_CACHE["data"] is board_data:
+                    _BOARD_CACHE["fn_labels"] = labels
+    return labels.get(key, default)
+
+
 def render_brief_template(card_data):
     """Render the brief markdown template with card metadata."""
     title = card_data.get("title", "Untitled")
@@ -454,56 +621,18 @@ def render_brief_template(card_data):
     # Look up function label — try reading from current board data
     fn_display = fn.replace("-", " ").replace("_", " ").title() if fn else ""
     try:
-        board_data, _ = read_board()
-        if board_data:
-            for f in board_data.get("functions", []):
-                if f.get("key") == fn:
-                    fn_display = f.get("label", fn_display)
-                    break
+        fn_display = get_fn_label(fn, fn_display)
     except Exception:
         pass
 
-    lines = [
-        f"# {title}",
-        "",
-        "## Objective",
-        "_What needs to happen and why._",
-        "",
-        "## Context",
-    ]
-    if owner:
-        lines.append(f"- **Owner:** {owner}")
-    if fn_display:
-        lines.append(f"- **Function:** {fn_display}")
-    lines.append(f"- **Priority:** {priority.capitalize()}")
-    if due:
-        lines.append(f"- **Due:** {due}")
-    lines.append(f"- **Created:** {today}")
-    lines += [
-        "",
-        "## Current Situation",
-        "_What is the current state? What has already been tried or decided?_",
-        "",
-        "## Actions Required",
-        "- [ ] ",
-        "- [ ] ",
-        "- [ ] ",
-        "",
-        "## Deliverables",
-        "_List what needs to be produced (email draft, document, ticket, etc.):_",
-        "- ",
-        "",
-        "## Done When",
-        "- ",
-        "",
-        "## Notes",
-    ]
-    if note:
-        lines.append(note)
-    else:
-        lines.append("")
-    lines.append("")
-    return "\n".join(lines)
+    context = "\n".join(filter(None, [
+        f"- **Owner:** {owner}" if owner else None,
+        f"- **Function:** {fn_display}" if fn_display else None,
+        f"- **Priority:** {priority.capitalize()}",
+        f"- **Due:** {due}" if due else None,
+        f"- **Created:** {today}",
+    ]))
+    return _BRIEF_TEMPLATE.format_map({"title": title, "context": context, "note": note or ""})
 
 
 def write_brief(card_data):
@@ -512,28 +641,17 @@ def write_brief(card_data):
     briefs_dir = vault / "Meticulous" / "Briefs"
     briefs_dir.mkdir(parents=True, exist_ok=True)
 
-    num = next_brief_number()
+    content = render_brief_template(card_data)
     slug = slugify(card_data.get("title", "untitled"))
-    filename = f"brief_{num:02d}_{slug}.md"
-    filepath = briefs_dir / filename
 
-    content = render_brief_template(card_data)
+    # Hold the lock from numbering through the rename so concurrent
+    # requests can't claim the same brief number
+    with _WRITE_LOCK:
+        num = next_brief_number()
+        filename = f"brief_{num:02d}_{slug}.md"
+        filepath = briefs_dir / filename
 
-    # Atomic write
-    fd, tmp = tempfile.mkstemp(dir=str(briefs_dir), suffix=".tmp")
-    closed = False
-    try:
-        os.write(fd, content.encode("utf-8"))
-        os.close(fd)
-        closed = True
-        os.replace(tmp, str(filepath))
-    except Exception:
-        if not closed:
-            try: os.close(fd)
-            except OSError: pass
-        if os.path.exists(tmp):
-            os.unlink(tmp)
-        raise
+        atomic_write(filepath, content.encode("utf-8"))
 
     # Return wiki link without .md extension
     wiki_path = f"Meticulous/Briefs/{filepath.stem}"
@@ -542,6 +660,67 @@ def write_brief(card_data):
 
 # ─── AI Assist ─────────────────────────────────────────────────
 
+# Idle keep-alive connections to the Claude API, reused across chats so
+# follow-up messages skip the TCP + TLS handshake
+_CLAUDE_POOL = []
+_CLAUDE_POOL_LOCK = threading.Lock()
+_CLAUDE_POOL_SIZE = 4
+
+
+def _claude_connection(url):
+    """Open a connection to the API host. Like urlopen(), an https URL is
+    tunnelled (CONNECT) through the proxy from getproxies() -- HTTPS_PROXY,
+    or the macOS/Windows system setting -- unless proxy_bypass() excludes it."""
+    if url.scheme != "https":
+        return HTTPConnection(url.netloc, timeout=60)
+    proxy = getproxies().get("https")
+    if not proxy or proxy_bypass(url.hostname):
+        return HTTPSConnection(url.netloc, timeout=60)
+    proxy = urlparse(proxy if "://" in proxy else f"http://{proxy}")
+    headers = {}
+    if proxy.username:
+        creds = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode("utf-8")).decode("ascii")
+    conn = HTTPSConnection(proxy.hostname, proxy.port, timeout=60)
+    conn.set_tunnel(url.hostname, url.port or 443, headers=headers)
+    return conn
+
+
+def claude_request(body):
+    """POST a JSON body to the Claude API over a pooled connection.
+    Returns (conn, response); pass both to release_claude_connection()."""
+    url = urlparse(CLAUDE_API_URL)
+    headers = {
+        "Content-Type": "application/json",
+        "x-api-key": ANTHROPIC_API_KEY,
+        "anthropic-version": "2023-06-01",
+    }
+    with _CLAUDE_POOL_LOCK:
+        conn = _CLAUDE_POOL.pop() if _CLAUDE_POOL else None
+    if conn is not None:
+        try:
+            conn.request("POST", url.path, body=body, headers=headers)
+            return conn, conn.getresponse()
+        except (ConnectionError, HTTPException):
+            # The server dropped the idle connection; retry on a fresh one
+            conn.close()
+    conn = _claude_connection(url)
+    try:
+        conn.request("POST", url.path, body=body, headers=headers)
+        return conn, conn.getresponse()
+    except Exception:
+        conn.close()
+        raise
+
+
+def release_claude_connection(conn, resp):
+    """Return a connection to the pool if its response was fully read."""
+    if resp is not None and resp.isclosed() and not resp.will_close:
+        with _CLAUDE_POOL_LOCK:
+            if len(_CLAUDE_POOL) < _CLAUDE_POOL_SIZE:
+                _CLAUDE_POOL.append(conn)
+                return
+    conn.close()
 
 
 def read_brief_content(link):
@@ -560,15 +739,34 @@ def build_system_prompt(card, brief_content, fn_label, pillar_desc):
     """Build the system prompt for AI chat from card context."""
     if not fn_label:
         fn_label = card.get("fn", "")
-
+    # Format each field up front so the cached renderer is keyed on strings;
+    # today is part of the key so the age line can't go stale overnight
+    return _render_system_prompt(
+        f"{card.get('title', '')}",
+        f"{card.get('col', '')}",
+        f"{card.get('priority', '')}",
+        f"{card.get('owner', '')}",
+        f"{card.get('due', '') or 'Not set'}",
+        f"{fn_label}",
+        f"{card.get('pillar', '')}",
+        f"{card.get('nextAction', '') or 'Not set'}",
+        f"{card.get('note', '') or 'None'}",
+        f"{card.get('movedAt', '') or ''}",
+        f"{pillar_desc}" if pillar_desc else "",
+        f"{brief_content}" if brief_content else "No brief linked to this card.",
+        date.today(),
+    )
+
+
+@lru_cache(maxsize=64)
+def _render_system_prompt(title, col, priority, owner, due, fn_label, pillar, next_action, note, moved, pillar_desc, brief, today):
     # Calculate age in column
     age = ""
-    moved = card.get("movedAt", "")
     if moved:
         try:
             from datetime import datetime
             moved_date = datetime.strptime(moved, "%Y-%m-%d").date()
-            age = str((date.today() - moved_date).days)
+            age = str((today - moved_date).days)
         except Exception:
             pass
 
@@ -576,15 +774,15 @@ def build_system_prompt(card, brief_content, fn_label, pillar_desc):
         "You are an AI assistant helping action a specific task on a priority board.",
         "",
         "## Card",
-        f"- Title: {card.get('title', '')}",
-        f"- Column: {card.get('col', '')} (current status)",
-        f"- Priority: {card.get('priority', '')}",
-        f"- Owner: {card.get('owner', '')}",
-        f"- Due: {card.get('due', '') or 'Not set'}",
+        f"- Title: {title}",
+        f"- Column: {col} (current status)",
+        f"- Priority: {priority}",
+        f"- Owner: {owner}",
+        f"- Due: {due}",
         f"- Function: {fn_label}",
-        f"- Pillar: {card.get('pillar', '')}",
-        f"- Next Action: {card.get('nextAction', '') or 'Not set'}",
-        f"- Note: {card.get('note', '') or 'None'}",
+        f"- Pillar: {pillar}",
+        f"- Next Action: {next_action}",
+        f"- Note: {note}",
     ]
     if age:
         lines.append(f"- In current column: {age} days")
@@ -596,7 +794,7 @@ def build_system_prompt(card, brief_content, fn_label, pillar_desc):
 
     lines.append("")
     lines.append("## Brief")
-    lines.append(brief_content if brief_content else "No brief linked to this card.")
+    lines.append(brief)
 
     lines.append("")
     lines.append("---")
@@ -618,37 +816,58 @@ def save_vault_file(rel_path, content):
     vault, _ = load_config()
     filepath = vault / rel_path
     filepath.parent.mkdir(parents=True, exist_ok=True)
-    # Atomic write
-    fd, tmp = tempfile.mkstemp(dir=str(filepath.parent), suffix=".tmp")
-    closed = False
-    try:
-        os.write(fd, content.encode("utf-8"))
-        os.close(fd)
-        closed = True
-        os.replace(tmp, str(filepath))
-    except Exception:
-        if not closed:
-            try: os.close(fd)
-            except OSError: pass
-        if os.path.exists(tmp):
-            os.unlink(tmp)
-        raise
+    atomic_write(filepath, content.encode("utf-8"))
     return str(filepath)
 
 
 # ─── HTTP Handler ──────────────────────────────────────────────
 
+# Fixed SSE event framing; only the JSON string value varies per event
+_SSE_TEXT = b'data: {"text": '
+_SSE_ERROR = b'data: {"error": '
+_SSE_END = b"}\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
+
+def sse_event(prefix, value):
+    """One complete SSE event as bytes: prefix + JSON string + _SSE_END."""
+    return prefix + _dumps(value) + _SSE_END
+
 
 class Handler(BaseHTTPRequestHandler):
+    # Keep-alive lets polling tabs reuse one connection. Every response sends
+    # Content-Length (or is a 304); the SSE stream sends Connection: close.
+    protocol_version = "HTTP/1.1"
+    # Socket timeout for every read and write. Writes block while a slow
+    # client's send buffer is full, which stops us reading the upstream
+    # stream (TCP flow control then throttles Claude); the timeout bounds
+    # how long a stalled client can hold the thread and upstream connection.
+    timeout = 60
+    # TCP_NODELAY: each SSE token, and a JSON body written after its
+    # headers on a keep-alive connection, goes out without Nagle's delay
+    disable_nagle_algorithm = True
+
     def log_message(self, format, *args):
         pass
 
-    def send_json(self, data, status=200):
-        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    def encode_body(self, body):
+        """gzip a response body when the client accepts it and it's worth it.
+        Returns (body, content_encoding or None)."""
+        if len(body) >= 1024 and "gzip" in self.headers.get("Accept-Encoding", ""):
+            return gzip.compress(body, compresslevel=1), "gzip"
+        return body, None
+
+    def send_json(self, data, status=200, headers=None):
+        body, encoding = self.encode_body(_dumps(data))
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", len(body))
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
         self.send_header("Access-Control-Allow-Origin", "*")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
         self.wfile.write(body)
 
@@ -657,6 +876,7 @@ class Handler(BaseHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
     def do_GET(self):
@@ -671,7 +891,26 @@ class Handler(BaseHTTPRequestHandler):
             if data is None:
                 data = create_default_board()
                 mtime = board_path().stat().st_mtime
-            self.send_json({"board": data, "mtime": mtime})
+            # mtime doubles as the ETag; no-cache makes the browser revalidate
+            # each poll, so unchanged boards come back as a bodiless 304.
+            # Weak, because the same board is served gzipped or plain.
+            etag = f'W/"{mtime}"'
+            if etag in (t.strip() for t in self.headers.get("If-None-Match", "").split(",")):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Vary", "Accept-Encoding")
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                return
+            self.send_json({"board": data, "mtime": mtime}, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+        elif parsed.path == "/api/board/mtime":
+            # Cheap change check for polling: one stat(), no read or parse
+            try:
+                mtime = board_path().stat().st_mtime
+            except OSError:
+                mtime = 0
+            self.send_json({"mtime": mtime})
 
         elif parsed.path == "/api/brief-content":
             qs = parse_qs(parsed.query)
@@ -686,10 +925,13 @@ class Handler(BaseHTTPRequestHandler):
         else:
             html_path = Path(__file__).parent / "index.html"
             if html_path.exists():
-                content = html_path.read_bytes()
+                content, encoding = self.encode_body(html_path.read_bytes())
                 self.send_response(200)
                 self.send_header("Content-Type", "text/html; charset=utf-8")
                 self.send_header("Content-Length", len(content))
+                self.send_header("Vary", "Accept-Encoding")
+                if encoding:
+                    self.send_header("Content-Encoding", encoding)
                 self.end_headers()
                 self.wfile.write(content)
             else:
@@ -702,7 +944,7 @@ class Handler(BaseHTTPRequestHandler):
 
         if parsed.path == "/api/board":
             try:
-                data = json.loads(body)
+                data = _loads(body)
             except Exception:
                 self.send_json({"error": "Invalid JSON"}, 400)
                 return
@@ -721,7 +963,7 @@ class Handler(BaseHTTPRequestHandler):
 
         if parsed.path == "/api/brief":
             try:
-                data = json.loads(body)
+                data = _loads(body)
             except Exception:
                 self.send_json({"error": "Invalid JSON"}, 400)
                 return
@@ -736,7 +978,7 @@ class Handler(BaseHTTPRequestHandler):
                 self.send_json({"error": "No API key configured"}, 403)
                 return
             try:
-                data = json.loads(body)
+                data = _loads(body)
             except Exception:
                 self.send_json({"error": "Invalid JSON"}, 400)
                 return
@@ -751,7 +993,7 @@ class Handler(BaseHTTPRequestHandler):
 
         elif parsed.path == "/api/vault/save":
             try:
-                data = json.loads(body)
+                data = _loads(body)
             except Exception:
                 self.send_json({"error": "Invalid JSON"}, 400)
                 return
@@ -762,25 +1004,12 @@ class Handler(BaseHTTPRequestHandler):
                 vault, _ = load_config()
                 briefs_dir = vault / "Meticulous" / "Briefs"
                 briefs_dir.mkdir(parents=True, exist_ok=True)
-                num = next_brief_number()
                 slug = slugify(title)
-                filename = f"brief_{num:02d}_{slug}.md"
-                filepath = briefs_dir / filename
-                # Atomic write
-                fd, tmp = tempfile.mkstemp(dir=str(briefs_dir), suffix=".tmp")
-                closed = False
-                try:
-                    os.write(fd, content.encode("utf-8"))
-                    os.close(fd)
-                    closed = True
-                    os.replace(tmp, str(filepath))
-                except Exception:
-                    if not closed:
-                        try: os.close(fd)
-                        except OSError: pass
-                    if os.path.exists(tmp):
-                        os.unlink(tmp)
-                    raise
+                with _WRITE_LOCK:
+                    num = next_brief_number()
+                    filename = f"brief_{num:02d}_{slug}.md"
+                    filepath = briefs_dir / filename
+                    atomic_write(filepath, content.encode("utf-8"))
                 wiki_path = f"Meticulous/Briefs/{filepath.stem}"
                 link = f"[[{wiki_path}]]"
                 self.send_json({"ok": True, "link": link})
@@ -789,12 +1018,13 @@ class Handler(BaseHTTPRequestHandler):
 
         elif parsed.path == "/config":
             try:
-                data = json.loads(body)
+                data = _loads(body)
             except Exception:
                 self.send_json({"error": "Invalid JSON"}, 400)
                 return
             with open(CONFIG_PATH, "w") as f:
                 json.dump(data, f, indent=2)
+            _CONFIG_CACHE["key"] = None
             print(f"  [config] Saved: {data}")
             self.send_json({"ok": True})
         else:
@@ -810,18 +1040,13 @@ class Handler(BaseHTTPRequestHandler):
 
         system_prompt = build_system_prompt(card, brief_content, fn_label, pillar_desc)
 
-        api_body = json.dumps({
+        api_body = _dumps({
             "model": CLAUDE_MODEL,
             "max_tokens": 4096,
             "stream": True,
             "system": system_prompt,
             "messages": messages,
-        }).encode("utf-8")
-
-        req = Request(CLAUDE_API_URL, data=api_body, method="POST")
-        req.add_header("Content-Type", "application/json")
-        req.add_header("x-api-key", ANTHROPIC_API_KEY)
-        req.add_header("anthropic-version", "2023-06-01")
+        })
 
         # Send SSE headers to client
         self.send_response(200)
@@ -831,82 +1056,112 @@ class Handler(BaseHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
 
+        # A closing error event goes out in the same write as [DONE]
+        tail = b""
+        conn = resp = None
         try:
-            resp = urlopen(req, timeout=60)
-            buf = ""
-            stream_done = False
-            while not stream_done:
-                chunk = resp.read(1024)
-                if not chunk:
-                    break
-                buf += chunk.decode("utf-8", errors="replace")
-                while "\n" in buf:
-                    line, buf = buf.split("\n", 1)
-                    line = line.strip()
-                    if not line:
-                        continue
-                    if line.startswith("data: "):
+            conn, resp = claude_request(api_body)
+            if resp.status >= 400:
+                # Error bodies are JSON: parse the bytes once and forward only
+                # the message; decode to text just for the non-JSON fallback
+                err_body = resp.read()
+                try:
+                    err_json = _loads(err_body)
+                    err_msg = err_json.get("error", {}).get("message", f"HTTP Error {resp.status}: {resp.reason}")
+                except Exception:
+                    err_msg = f"API error {resp.status}: {err_body[:200].decode('utf-8', errors='replace')}"
+                tail = sse_event(_SSE_ERROR, err_msg)
+            else:
+                # Parse SSE lines as bytes; _loads() decodes each data payload
+                # itself. read1() returns whatever has arrived (up to 16 KiB)
+                # instead of blocking until a fixed-size chunk fills up.
+                buf = bytearray()
+                stream_done = client_gone = False
+                # Locals for the per-token loop (LOAD_FAST, no attribute or
+                # global lookups); same framing as sse_event(). wfile is
+                # unbuffered (wbufsize = 0), so each write is sent at once
+                # and needs no flush().
+                read1, loads = resp.read1, _loads
+                write, dumps = self.wfile.write, _dumps
+                text_prefix, event_end = _SSE_TEXT, _SSE_END
+                while not stream_done:
+                    chunk = read1(16384)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    start = 0
+                    while True:
+                        nl = buf.find(b"\n", start)
+                        if nl == -1:
+                            break
+                        line = buf[start:nl].strip()
+                        start = nl + 1
+                        if not line.startswith(b"data: "):
+                            continue
                         event_data = line[6:]
-                        if event_data.strip() == "[DONE]":
+                        if event_data.strip() == b"[DONE]":
                             stream_done = True
                             break
                         try:
-                            evt = json.loads(event_data)
+                            evt = loads(event_data)
                             evt_type = evt.get("type", "")
                             if evt_type == "content_block_delta":
                                 delta = evt.get("delta", {})
                                 text = delta.get("text", "")
                                 if text:
-                                    sse = f"data: {json.dumps({'text': text})}\n\n"
-                                    self.wfile.write(sse.encode("utf-8"))
-                                    self.wfile.flush()
+                                    try:
+                                        write(text_prefix + dumps(text) + event_end)
+                                    except OSError:
+                                        # The client went away; stop reading so
+                                        # the unfinished upstream response is
+                                        # closed, not pooled, ending generation
+                                        client_gone = stream_done = True
+                                        break
                             elif evt_type == "message_stop":
                                 stream_done = True
                                 break
                             elif evt_type == "error":
                                 err_msg = evt.get("error", {}).get("message", "Unknown error")
-                                sse = f"data: {json.dumps({'error': err_msg})}\n\n"
-                                self.wfile.write(sse.encode("utf-8"))
-                                self.wfile.flush()
+                                tail = sse_event(_SSE_ERROR, err_msg)
                                 stream_done = True
                                 break
-                        except json.JSONDecodeError:
+                        except ValueError:
+                            # Malformed JSON or UTF-8 in one event; skip it
                             pass
-            resp.close()
-        except HTTPError as e:
-            err_body = e.read().decode("utf-8", errors="replace")
-            try:
-                err_json = json.loads(err_body)
-                err_msg = err_json.get("error", {}).get("message", str(e))
-            except Exception:
-                err_msg = f"API error {e.code}: {err_body[:200]}"
-            sse = f"data: {json.dumps({'error': err_msg})}\n\n"
-            self.wfile.write(sse.encode("utf-8"))
-            self.wfile.flush()
+                    del buf[:start]
+                if client_gone:
+                    return
+                # Drain the tail of the stream so the connection can be reused
+                resp.read()
         except Exception as e:
-            sse = f"data: {json.dumps({'error': str(e)})}\n\n"
-            self.wfile.write(sse.encode("utf-8"))
-            self.wfile.flush()
+            tail = sse_event(_SSE_ERROR, str(e))
+        finally:
+            if conn is not None:
+                release_claude_connection(conn, resp)
 
         # Send done signal
-        self.wfile.write(b"data: [DONE]\n\n")
-        self.wfile.flush()
+        try:
+            self.wfile.write(tail + _SSE_DONE)
+            self.wfile.flush()
+        except OSError:
+            pass  # client already disconnected
 
 
 if __name__ == "__main__":
     vault, board_file = load_config()
     fp = vault / board_file
-    print(f"\n  Meticulous Board Server")
-    print(f"  URL:    http://localhost:{PORT}")
-    print(f"  Vault:  {vault}")
-    print(f"  Board:  {board_file}")
-    print(f"  File:   {fp}")
-    if ANTHROPIC_API_KEY:
-        print(f"  AI:     Enabled (API key set)")
-    else:
-        print(f"  AI:     Disabled (set ANTHROPIC_API_KEY to enable)")
-    print(f"  Ready. Open http://localhost:{PORT} in your browser.\n")
-    server = HTTPServer(("localhost", PORT), Handler)
+    ai_status = "Enabled (API key set)" if ANTHROPIC_API_KEY else "Disabled (set ANTHROPIC_API_KEY to enable)"
+    sys.stdout.write(
+        f"\n  Meticulous Board Server\n"
+        f"  URL:    http://localhost:{PORT}\n"
+        f"  Vault:  {vault}\n"
+        f"  Board:  {board_file}\n"
+        f"  File:   {fp}\n"
+        f"  AI:     {ai_status}\n"
+        f"  Ready. Open http://localhost:{PORT} in your browser.\n\n"
+    )
+    sys.stdout.flush()
+    server = ThreadingHTTPServer(("localhost", PORT), Handler)
     try:
         server.serve_forever()
     except KeyboardInterrupt: